@@ -9,7 +9,7 @@ from src.gui.components import ControlButton, SettingsSection, StatusDisplay, Ta
 from src.gui.help_window import HelpWindow
 from src.gui.settings_window import SettingsWindow
 from src.gui.utils import log_message
-from src.gui.zodiac_config import ZODIAC_RARITIES
+from src.gui.zodiac_config import RGB_TO_RARITY, ZODIAC_RARITIES
 from src.gui.zodiac_grid_widget import ZodiacGridWidget
 from src.gui.advanced_setup_window import AdvancedSetupWindow
 from src.gui.automation_config_window import AutomationConfigWindow
@@ -24,6 +24,7 @@ __all__ = [
     "HelpWindow",
     "SettingsWindow",
     "log_message",
+    "RGB_TO_RARITY",
     "ZODIAC_RARITIES",
     "ZodiacGridWidget",
     "AdvancedSetupWindow",
@@ -6,10 +6,14 @@ Revolution Idle Sacrifice Automation script, replacing the CLI interface
 when GUI mode is selected.
 """
 
+import concurrent.futures
 import logging
+import queue
 import threading
 import time
-from typing import Optional, Dict, Any
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Optional, Dict, Tuple
 import os
 import sys
 import json
@@ -19,7 +23,7 @@ import pynput.keyboard
 import pynput.mouse
 
 from config.config_manager import ConfigManager
-from config.settings import STOP_KEY
+from config.settings import CONFIG_FILE, STOP_KEY
 from src.automation_engine import AutomationEngine
 from .automation_config_window import AutomationConfigWindow
 from .help_window import HelpWindow
@@ -33,6 +37,23 @@ from src.setup_manager import SetupManager
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+# Maximum number of lines kept in the activity log textbox; Tk Text
+# performance degrades as the buffer grows, so old lines are trimmed
+MAX_LOG_LINES = 2000
+
+# Number of lines retained after a trim. Trimming down to a lower floor
+# instead of to the cap means each delete reclaims a big block at once,
+# so trims stay rare
+_LOG_KEEP_LINES = 1500
+
+# How many log flushes may pass between trim checks (amortizes the
+# line-count query)
+_LOG_TRIM_INTERVAL = 32
+
+# Interval of the UI pump that drains cross-thread work onto the Tk
+# thread (~60 updates per second)
+_UI_PUMP_MS = 16
+
 
 class RevolutionIdleGUI:
     """GUI application controller for Revolution Idle Sacrifice Automation."""
@@ -46,10 +67,21 @@ class RevolutionIdleGUI:
         self.automation_engine = AutomationEngine()
         self.setup_manager = SetupManager(self.config_manager)
         self.keyboard_handler = KeyboardHandler(self._on_stop_automation)
+        # The setup manager keeps one mouse handler for its lifetime, so the
+        # reference is resolved once instead of per setup session
+        self._setup_mouse_handler = self.setup_manager.get_mouse_handler()
 
-        # Input listeners
+        # Input listeners - created once and kept alive for the life of the
+        # app; sessions swap the dispatched callback instead of paying thread
+        # creation/teardown per setup or automation run
         self.mouse_listener: Optional[pynput.mouse.Listener] = None
         self.keyboard_listener: Optional[pynput.keyboard.Listener] = None
+        self._mouse_cb: Callable[..., None] = self._noop_input_cb
+        self._key_cb: Callable[..., None] = self._noop_input_cb
+        # Gate for the mouse shim: only dispatch click events while a setup
+        # session is actually awaiting clicks, so fast cursor activity outside
+        # setup costs a single flag check instead of a Python callback
+        self._click_awaited = threading.Event()
 
         # GUI components
         self.root: Optional[ctk.CTk] = None
@@ -59,20 +91,67 @@ class RevolutionIdleGUI:
         self.setup_button: Optional[ctk.CTkButton] = None
         self.mode_switch: Optional[ctk.CTkSwitch] = None
 
-        # Windows
+        # Windows - help and setup instructions are built once and then
+        # hidden/shown, since rebuilding the CTk widget trees is expensive
         self.setup_window: Optional[SetupInstructionsWindow] = None
+        self.help_window: Optional[HelpWindow] = None
         self.settings_window: Optional[SettingsWindow] = None
         self.automation_config_window: Optional[AutomationConfigWindow] = None
 
-        # State management
-        self.automation_thread: Optional[threading.Thread] = None
-        self.is_automation_running = False
+        # Log batching - messages are queued and flushed to the textbox in a
+        # single insert per idle tick instead of one widget mutation per line
+        self._log_queue: Deque[Tuple[str, str]] = deque()
+        self._log_flush_count = 0
+        # Timestamp cache - log bursts usually land within the same second,
+        # so the formatted time string is reused until the second rolls over
+        self._ts_cache_sec = -1
+        self._ts_cache_str = ""
+
+        # Cross-thread UI marshalling - background threads never touch Tk
+        # widgets directly; they enqueue callables here and a single 16ms
+        # pump on the Tk thread drains the queue
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+
+        # Shared worker pool for setup and automation runs - reusing the
+        # threads avoids paying OS thread creation per run
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="ri-auto"
+        )
+
+        # State management. The stop event doubles as the running flag: set
+        # means "stopped/stop requested", so its bound C-level is_set can be
+        # handed to the engine directly as the stop predicate.
+        self.automation_future: Optional[concurrent.futures.Future] = None
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.setup_in_progress = False
         self.window_detection_disabled = False
 
+        # Cached result of config_manager.validate_config(); invalidated
+        # whenever the configuration is loaded or saved
+        self._config_valid_cache: Optional[bool] = None
+
+        # Button refresh coalescing - several state transitions in the same
+        # event tick collapse into one widget refresh
+        self._btn_refresh_scheduled = False
+        self._last_btn_state: Optional[tuple] = None
+
+        # Last text pushed to the status label / setup instructions; equal
+        # strings are dropped before they reach configure() and a relayout
+        self._last_status = ""
+        self._last_instructions = ""
+
+        # Shared CTkFont instances, populated once the root window exists
+        self._fonts: Dict[str, ctk.CTkFont] = {}
+
         # Get GUI scale factor from settings
         self.gui_scale = self._get_gui_scale_factor()
 
+    @property
+    def is_automation_running(self) -> bool:
+        """Whether an automation run is currently active."""
+        return not self._stop_event.is_set()
+
     def _get_gui_scale_factor(self) -> float:
         """Get the GUI scale factor from settings."""
         try:
@@ -121,11 +200,40 @@ class RevolutionIdleGUI:
     def run(self) -> None:
         """Initialize and run the GUI application."""
         self._create_gui()
-        self._load_initial_config()
         if self.root:
             logger.info("Starting GUI main loop")
+            self.root.after(_UI_PUMP_MS, self._pump)
+            # Load the config after the first paint so the window is not
+            # held back by disk I/O
+            self.root.after(10, self._load_initial_config_async)
             self.root.mainloop()
 
+    def _post(self, work: Callable[[], None]) -> None:
+        """Queue a callable to run on the Tk thread at the next pump tick.
+
+        Safe to call from any thread; SimpleQueue.put is lock-free in
+        CPython.
+        """
+        self._ui_queue.put(work)
+
+    def _pump(self) -> None:
+        """Drain queued cross-thread work and log messages on the Tk thread."""
+        while True:
+            try:
+                work = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                work()
+            except Exception:  # pylint: disable=broad-except
+                logger.error("Error running queued UI work", exc_info=True)
+
+        if self._log_queue:
+            self._flush_log()
+
+        if self.root:
+            self.root.after(_UI_PUMP_MS, self._pump)
+
     def _create_gui(self) -> None:
         """Create the main GUI window and components."""
         logger.debug("Creating GUI components")
@@ -142,13 +250,25 @@ class RevolutionIdleGUI:
         # Create main window
         self.root = ctk.CTk()
         self.root.title("Revolution Idle Sacrifice Automation")
-        self.root.geometry("800x600")  # Smaller default size
-        self.root.minsize(600, 450)  # Smaller minimum size
+        self.root.protocol("WM_DELETE_WINDOW", self._on_app_close)
 
         # Configure grid weights for responsive layout
         self.root.grid_rowconfigure(1, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
 
+        # Each CTkFont construction registers a Tk font object, so every
+        # distinct style is created once here and shared by all widgets
+        self._fonts = {
+            "icon_large": ctk.CTkFont(size=28),
+            "title": ctk.CTkFont(size=20, weight="bold"),
+            "heading": ctk.CTkFont(size=14, weight="bold"),
+            "button_bold": ctk.CTkFont(size=13, weight="bold"),
+            "body": ctk.CTkFont(size=12),
+            "body_bold": ctk.CTkFont(size=12, weight="bold"),
+            "icon": ctk.CTkFont(size=16),
+            "small": ctk.CTkFont(size=11),
+        }
+
         # Create header frame
         header_frame = ctk.CTkFrame(self.root, fg_color="transparent")
         header_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
@@ -163,7 +283,7 @@ class RevolutionIdleGUI:
         logo_label = ctk.CTkLabel(
             title_frame,
             text="⚡",  # Unicode lightning bolt as placeholder
-            font=ctk.CTkFont(size=28),
+            font=self._fonts["icon_large"],
             width=40,
             height=40,
         )
@@ -176,7 +296,7 @@ class RevolutionIdleGUI:
         title_label = ctk.CTkLabel(
             title_container,
             text="Revolution Idle Automation",  # Shortened title
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self._fonts["title"],
             anchor="w",
         )
         title_label.pack(anchor="w")
@@ -184,7 +304,7 @@ class RevolutionIdleGUI:
         subtitle_label = ctk.CTkLabel(
             title_container,
             text="Automate zodiac sacrificing",  # Shortened subtitle
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["body"],
             text_color=("gray70", "gray45"),
             anchor="w",
         )
@@ -198,7 +318,7 @@ class RevolutionIdleGUI:
         status_indicator = ctk.CTkLabel(
             status_frame,
             text="●",
-            font=ctk.CTkFont(size=16),
+            font=self._fonts["icon"],
             text_color=("gray60", "gray60"),
             width=15,
         )
@@ -207,7 +327,7 @@ class RevolutionIdleGUI:
         self.status_label = ctk.CTkLabel(
             status_frame,
             text="Ready",
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["body"],
             anchor="w",
         )
         self.status_label.grid(row=0, column=1, sticky="w")
@@ -242,14 +362,14 @@ class RevolutionIdleGUI:
         auto_icon = ctk.CTkLabel(
             automation_header,
             text="🚀",  # Rocket emoji
-            font=ctk.CTkFont(size=16),
+            font=self._fonts["icon"],
         )
         auto_icon.pack(side="left", padx=(0, 3))
 
         auto_label = ctk.CTkLabel(
             automation_header,
             text="Automation",  # Shortened label
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._fonts["body_bold"],
         )
         auto_label.pack(side="left")
 
@@ -260,7 +380,7 @@ class RevolutionIdleGUI:
         mode_label = ctk.CTkLabel(
             mode_frame,
             text="Mode:",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts["small"],
             text_color=("gray70", "gray50"),
         )
         mode_label.pack(side="left", padx=(0, 5))
@@ -270,7 +390,7 @@ class RevolutionIdleGUI:
             mode_frame,
             text="Advanced",
             command=self._on_mode_toggle,
-            font=ctk.CTkFont(size=11),
+            font=self._fonts["small"],
             width=80,
         )
         self.mode_switch.pack(side="left")
@@ -285,7 +405,7 @@ class RevolutionIdleGUI:
             command=self._on_automation_click,
             width=button_width,
             height=button_height + 5,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._fonts["button_bold"],
             fg_color=("green", "green"),
             hover_color=(
                 "#009000",
@@ -307,7 +427,7 @@ class RevolutionIdleGUI:
         controls_label = ctk.CTkLabel(
             config_section,
             text="CONFIGURATION",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts["small"],
             text_color=("gray60", "gray60"),
             anchor="w",
         )
@@ -320,7 +440,7 @@ class RevolutionIdleGUI:
             command=self._on_setup_click,
             width=button_width,
             height=button_height,
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["body"],
             corner_radius=6,
         )
         self.setup_button.pack(fill="x", padx=5, pady=3)
@@ -331,7 +451,7 @@ class RevolutionIdleGUI:
             command=self._on_settings_click,
             width=button_width,
             height=button_height,
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["body"],
             corner_radius=6,
         )
         settings_button.pack(fill="x", padx=5, pady=3)
@@ -343,7 +463,7 @@ class RevolutionIdleGUI:
         help_label = ctk.CTkLabel(
             help_section,
             text="HELP & SUPPORT",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts["small"],
             text_color=("gray60", "gray60"),
             anchor="w",
         )
@@ -355,7 +475,7 @@ class RevolutionIdleGUI:
             command=self._on_help_click,
             width=button_width,
             height=button_height,
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["body"],
             corner_radius=6,
         )
         help_button.pack(fill="x", padx=5, pady=3)
@@ -374,14 +494,14 @@ class RevolutionIdleGUI:
         log_icon = ctk.CTkLabel(
             log_header,
             text="📋",  # Unicode clipboard icon
-            font=ctk.CTkFont(size=16),
+            font=self._fonts["icon"],
         )
         log_icon.grid(row=0, column=0, padx=(0, 3))
 
         log_label = ctk.CTkLabel(
             log_header,
             text="Activity Log",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._fonts["heading"],
             anchor="w",
         )
         log_label.grid(row=0, column=1, sticky="w")
@@ -392,25 +512,46 @@ class RevolutionIdleGUI:
         log_container.grid_rowconfigure(0, weight=1)
         log_container.grid_columnconfigure(0, weight=1)
 
+        # Flat styling: rounded corners and theme borders make CTkTextbox
+        # redraw its backing canvas on every insert/resize, which is the
+        # hot path for a constantly-appending log. The container frame
+        # already provides the border.
         self.log_textbox = ctk.CTkTextbox(
             log_container,
             wrap="word",
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["body"],
+            corner_radius=0,
+            border_width=0,
         )
         self.log_textbox.grid(row=0, column=0, sticky="nsew", padx=1, pady=1)
 
         # Initially disable automation button if no config
-        self._update_button_states()
+        self._request_button_refresh()
+
+        # Set the window geometry only after every child is gridded, so Tk
+        # runs geometry propagation once instead of per widget add
+        self.root.geometry("800x600")  # Smaller default size
+        self.root.minsize(600, 450)  # Smaller minimum size
 
         logger.debug("GUI components created")
 
-    def _load_initial_config(self) -> None:
-        """Load configuration at startup."""
-        if self.config_manager.load_config():
-            from config.settings import (  # pylint: disable=import-outside-toplevel
-                CONFIG_FILE,
-            )
+    def _load_initial_config_async(self) -> None:
+        """Load the configuration on the worker pool at startup.
 
+        The JSON parse happens off the Tk thread; the resulting GUI updates
+        are posted back through the UI queue.
+        """
+
+        def _worker() -> None:
+            loaded = self.config_manager.load_config()
+            self._post(partial(self._on_initial_config_loaded, loaded))
+
+        self._executor.submit(_worker)
+
+    def _on_initial_config_loaded(self, loaded: bool) -> None:
+        """Apply GUI state once the startup configuration load finishes."""
+        self._invalidate_config_cache()
+        if loaded:
             self._log_message(f"Configuration loaded from {CONFIG_FILE}")
             self._update_status("Configuration loaded")
             logger.info("Configuration loaded from %s", CONFIG_FILE)
@@ -419,11 +560,15 @@ class RevolutionIdleGUI:
             self._update_status("No configuration - Setup required")
             logger.info("No configuration found")
 
-        self._update_button_states()
+        self._request_button_refresh()
         self._update_mode_switch()
 
     def _update_status(self, message: str) -> None:
-        """Update the status label and indicator."""
+        """Update the status label and indicator, skipping no-op updates."""
+        if message == self._last_status:
+            return
+        self._last_status = message
+
         if self.status_label:
             self.status_label.configure(text=message)
 
@@ -447,47 +592,161 @@ class RevolutionIdleGUI:
             logger.debug("Status updated: %s", message)
 
     def _log_message(self, message: str) -> None:
-        """Add a message to the log textbox."""
-        log_message(self.log_textbox, message)
+        """Queue a message for the log textbox, flushed on the next pump tick.
+
+        Only the deque is touched here, so this is safe to call from
+        background threads; the pump performs the actual widget insert on
+        the Tk thread.
+        """
         logger.info(message)
 
+        if self.root is None:
+            # No event loop yet - write straight to the textbox
+            log_message(self.log_textbox, message)
+            return
+
+        now = int(time.time())
+        if now != self._ts_cache_sec:
+            lt = time.localtime(now)
+            self._ts_cache_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+            self._ts_cache_sec = now
+        # Formatting is deferred to the flush, which builds each timestamp
+        # prefix once per burst instead of one f-string per message
+        self._log_queue.append((self._ts_cache_str, message))
+
+    def _flush_log(self) -> None:
+        """Flush all queued log messages to the textbox in a single insert."""
+        if not self._log_queue:
+            return
+        if self.log_textbox is None:
+            self._log_queue.clear()
+            return
+
+        parts = []
+        last_ts: Optional[str] = None
+        prefix = ""
+        while self._log_queue:
+            ts, msg = self._log_queue.popleft()
+            # The timestamp cache hands out the same string object within a
+            # second, so an identity check suffices here
+            if ts is not last_ts:
+                prefix = f"[{ts}] "
+                last_ts = ts
+            parts.extend((prefix, msg, "\n"))
+        batch = "".join(parts)
+
+        try:
+            # Respect a user who scrolled up to read history: only
+            # auto-scroll when the view is already near the bottom
+            at_bottom = self.log_textbox.yview()[1] > 0.95
+
+            self.log_textbox.configure(state="normal")
+            self.log_textbox.insert("end", batch)
+
+            # Periodically trim old lines so the Text widget stays bounded
+            self._log_flush_count += 1
+            if self._log_flush_count % _LOG_TRIM_INTERVAL == 0:
+                lines = int(self.log_textbox.index("end-1c").split(".")[0])
+                if lines > MAX_LOG_LINES:
+                    self.log_textbox.delete("1.0", f"{lines - _LOG_KEEP_LINES}.0")
+
+            if at_bottom:
+                self.log_textbox.see("end")
+            self.log_textbox.configure(state="disabled")
+        except Exception:  # pylint: disable=broad-except
+            logger.error("Error flushing log messages to textbox", exc_info=True)
+
+    def _has_valid_config(self) -> bool:
+        """Return whether the current configuration is valid, using a cache.
+
+        Validation walks the whole config dict, so the result is memoized and
+        recomputed only after the configuration changes.
+        """
+        if self._config_valid_cache is None:
+            self._config_valid_cache = self.config_manager.validate_config()
+        return self._config_valid_cache
+
+    def _invalidate_config_cache(self) -> None:
+        """Drop the cached validation result after a config load/save."""
+        self._config_valid_cache = None
+
+    def _request_button_refresh(self) -> None:
+        """Schedule a coalesced button-state refresh on the next idle tick."""
+        if self.root is None:
+            self._update_button_states()
+            return
+        if not self._btn_refresh_scheduled:
+            self._btn_refresh_scheduled = True
+            self.root.after_idle(self._do_button_refresh)
+
+    def _do_button_refresh(self) -> None:
+        """Refresh button states if the derived state actually changed."""
+        self._btn_refresh_scheduled = False
+
+        state = (
+            self.is_automation_running,
+            self.setup_in_progress,
+            self._has_valid_config(),
+        )
+        if state == self._last_btn_state:
+            return
+        self._last_btn_state = state
+        self._update_button_states()
+
+    @staticmethod
+    def _cfg_if_changed(widget: Any, **kwargs: Any) -> None:
+        """Apply only the configure options whose values actually differ.
+
+        CTk widgets redraw on every configure call regardless of whether the
+        value changed, so unchanged options are filtered out first.
+        """
+        changed = {key: val for key, val in kwargs.items() if widget.cget(key) != val}
+        if changed:
+            widget.configure(**changed)
+
     def _update_button_states(self) -> None:
         """Update button states based on current configuration and automation status."""
-        has_config = self.config_manager.validate_config()
+        has_config = self._has_valid_config()
 
         if self.automation_button:
             if self.is_automation_running:
-                self.automation_button.configure(
+                self._cfg_if_changed(
+                    self.automation_button,
                     text="Stop Automation",
                     fg_color="red",
                     hover_color="#C00000",  # Slightly darker red for subtle hover effect
                 )
                 logger.debug("Automation button set to 'Stop'")
             elif has_config:
-                self.automation_button.configure(
+                self._cfg_if_changed(
+                    self.automation_button,
                     text="Start Automation",
                     fg_color=("green", "green"),
                     hover_color=(
                         "#009000",
                         "#009000",
                     ),  # Slightly darker green for subtle hover effect
+                    state="normal",
                 )
-                self.automation_button.configure(state="normal")
                 logger.debug("Automation button enabled")
             else:
-                self.automation_button.configure(
-                    text="Start Automation", state="disabled"
+                self._cfg_if_changed(
+                    self.automation_button,
+                    text="Start Automation",
+                    state="disabled",
                 )
                 logger.debug("Automation button disabled - no config")
 
         if self.setup_button:
             if self.setup_in_progress:
-                self.setup_button.configure(
-                    text="Setup in Progress...", state="disabled"
+                self._cfg_if_changed(
+                    self.setup_button, text="Setup in Progress...", state="disabled"
                 )
                 logger.debug("Setup button disabled - setup in progress")
             else:
-                self.setup_button.configure(text="Automation Config", state="normal")
+                self._cfg_if_changed(
+                    self.setup_button, text="Automation Config", state="normal"
+                )
                 logger.debug("Setup button enabled")
 
     def _on_setup_click(self) -> None:
@@ -567,7 +826,8 @@ class RevolutionIdleGUI:
                     self._log_message("ERROR: Failed to save configuration!")
 
             # Update the UI to reflect the new configuration
-            self._update_button_states()
+            self._invalidate_config_cache()
+            self._request_button_refresh()
             self._update_mode_switch()
 
         except Exception as e:
@@ -578,9 +838,12 @@ class RevolutionIdleGUI:
         """Start the actual setup process after configuration window."""
         # Reset window detection state for new setup session
         self.window_detection_disabled = False
+        # The reused instructions window resets its label, so the duplicate
+        # filter must forget the previous session's last text
+        self._last_instructions = ""
 
         self.setup_in_progress = True
-        self._update_button_states()
+        self._request_button_refresh()
         self._update_status("Setup mode active")
         self._log_message("Starting setup mode...")
         logger.info("Setup mode started")
@@ -588,16 +851,19 @@ class RevolutionIdleGUI:
         # Show instructions window
         self._show_setup_instructions()
 
-        # Set up the setup manager to use GUI callbacks
+        # Set up the setup manager to use GUI callbacks. The setup worker
+        # and the mouse handler's click worker invoke these off the Tk
+        # thread, so widget-touching callbacks go through the UI queue
+        # (_log_message is already thread-safe)
         self.setup_manager.set_gui_callbacks(
-            self._update_setup_instructions, self._log_message, self._show_error_dialog
+            self._post_setup_instructions,
+            self._log_message,
+            self._post_error_dialog,
         )
 
-        # Run setup in a separate thread to avoid blocking GUI
-        setup_thread = threading.Thread(target=self._run_setup_thread)
-        setup_thread.daemon = True
-        setup_thread.start()
-        logger.debug("Setup thread started")
+        # Run setup on the worker pool to avoid blocking the GUI
+        self._executor.submit(self._run_setup_thread)
+        logger.debug("Setup task submitted")
 
     def _run_setup_thread(self) -> None:
         """Run setup mode in a separate thread."""
@@ -609,41 +875,62 @@ class RevolutionIdleGUI:
             self.setup_manager.run_setup_mode()
 
             # Update GUI after setup completion
-            if self.root and not self.setup_manager.setup_cancelled:
-                self.root.after(0, self._on_setup_complete)
-            elif self.root and self.setup_manager.setup_cancelled:
-                self.root.after(0, self._on_setup_cancelled)
+            if not self.setup_manager.setup_cancelled:
+                self._post(self._on_setup_complete)
+            else:
+                self._post(self._on_setup_cancelled)
 
         except Exception as e:  # pylint: disable=broad-except
-            if self.root:
-                self.root.after(0, lambda err=str(e): self._on_setup_error(err))
+            self._post(partial(self._on_setup_error, str(e)))
         finally:
             # Stop listeners
             self._stop_listeners()
 
+    @staticmethod
+    def _noop_input_cb(*_args: Any) -> None:
+        """Placeholder input callback installed while no session is active."""
+
+    def _on_mouse_event(
+        self, x: int, y: int, button: Any, pressed: bool
+    ) -> None:
+        """Dispatch a mouse event to the currently installed callback."""
+        if self._click_awaited.is_set():
+            self._mouse_cb(x, y, button, pressed)
+
+    def _on_key_event(self, key: Any) -> None:
+        """Dispatch a key press to the currently installed callback."""
+        self._key_cb(key)
+
     def _start_listeners(self) -> None:
-        """Start mouse and keyboard listeners."""
-        # Start mouse listener for setup
-        mouse_handler = self.setup_manager.get_mouse_handler()
-        self.mouse_listener = pynput.mouse.Listener(on_click=mouse_handler.on_click)
-        self.mouse_listener.start()
+        """Install the setup mouse callback, starting the shared listener once."""
+        self._mouse_cb = self._setup_mouse_handler.on_click
+        self._click_awaited.set()
+        if self.mouse_listener is None:
+            self.mouse_listener = pynput.mouse.Listener(on_click=self._on_mouse_event)
+            self.mouse_listener.start()
 
     def _start_automation_keyboard_listener(self) -> None:
-        """Start keyboard listener for automation."""
-        self.keyboard_listener = pynput.keyboard.Listener(
-            on_press=self.keyboard_handler.on_press
-        )
-        self.keyboard_listener.start()
+        """Install the automation key callback, starting the shared listener once."""
+        self._key_cb = self.keyboard_handler.on_press
+        if self.keyboard_listener is None:
+            self.keyboard_listener = pynput.keyboard.Listener(
+                on_press=self._on_key_event
+            )
+            self.keyboard_listener.start()
         self._log_message(f"Press {STOP_KEY.upper()} to stop automation")
 
     def _stop_automation_keyboard_listener(self) -> None:
-        """Stop the keyboard listener for automation."""
-        if self.keyboard_listener:
-            self.keyboard_listener.stop()
-            self.keyboard_listener = None
+        """Detach the automation key callback, keeping the listener alive."""
+        self._key_cb = self._noop_input_cb
 
     def _stop_listeners(self) -> None:
-        """Stop all input listeners."""
+        """Detach all input callbacks, keeping the listener threads alive."""
+        self._click_awaited.clear()
+        self._mouse_cb = self._noop_input_cb
+        self._key_cb = self._noop_input_cb
+
+    def _shutdown_listeners(self) -> None:
+        """Stop the shared listener threads at application exit."""
         if self.mouse_listener:
             self.mouse_listener.stop()
             self.mouse_listener = None
@@ -651,46 +938,59 @@ class RevolutionIdleGUI:
             self.keyboard_listener.stop()
             self.keyboard_listener = None
 
-    def _on_setup_complete(self) -> None:
-        """Handle setup completion."""
-        self.setup_in_progress = False
-        self._update_button_states()
-        self._update_status("Setup complete")
-        self._log_message("Setup completed successfully!")
+    def _finish_setup_session(
+        self, status: str, message: Optional[str] = None
+    ) -> None:
+        """Shared teardown for setup completion, failure and cancellation.
 
-        # Close setup instructions window
+        Hides the instructions window and refreshes state exactly once,
+        regardless of which path ended the session.
+        """
+        self.setup_in_progress = False
+        self._request_button_refresh()
+        self._update_status(status)
+        if message:
+            self._log_message(message)
         self._close_setup_window()
 
-        # Update button states to enable automation
-        self._update_button_states()
+    def _on_setup_complete(self) -> None:
+        """Handle setup completion."""
+        self._invalidate_config_cache()
+        self._finish_setup_session("Setup complete", "Setup completed successfully!")
 
     def _on_setup_error(self, error_msg: str) -> None:
         """Handle setup error."""
-        self.setup_in_progress = False
-        self._update_button_states()
-        self._update_status("Setup failed")
-        self._log_message(f"Setup failed: {error_msg}")
-        self._close_setup_window()
+        self._finish_setup_session("Setup failed", f"Setup failed: {error_msg}")
 
     def _on_setup_cancelled(self) -> None:
         """Handle setup cancellation."""
-        self.setup_in_progress = False
-        self._update_button_states()
-        self._update_status("Setup cancelled")
-        self._log_message("Setup was cancelled")
-        self._close_setup_window()
+        self._finish_setup_session("Setup cancelled", "Setup was cancelled")
 
     def _show_setup_instructions(self) -> None:
-        """Show the setup instructions window."""
-        self.setup_window = SetupInstructionsWindow(
-            self.root,
-            self._cancel_setup,
-            self._disable_window_detection,
-            self._enable_debug_mode,
-        )
+        """Show the setup instructions window, reusing it across sessions."""
+        if self.setup_window is None:
+            self.setup_window = SetupInstructionsWindow(
+                self.root,
+                self._cancel_setup,
+                self._disable_window_detection,
+                self._enable_debug_mode,
+            )
+        else:
+            self.setup_window.show()
+
+    def _post_setup_instructions(self, message: str) -> None:
+        """Marshal a setup instruction update onto the Tk thread."""
+        self._post(partial(self._update_setup_instructions, message))
+
+    def _post_error_dialog(self, title: str, message: str) -> None:
+        """Marshal an error dialog request onto the Tk thread."""
+        self._post(partial(self._show_error_dialog, title, message))
 
     def _update_setup_instructions(self, message: str) -> None:
-        """Update the setup instructions text."""
+        """Update the setup instructions text, skipping no-op updates."""
+        if message == self._last_instructions:
+            return
+        self._last_instructions = message
         if self.setup_window:
             self.setup_window.update_instructions(message)
 
@@ -700,10 +1000,7 @@ class RevolutionIdleGUI:
             self.setup_manager.cancel_setup()
             self._log_message("Setup cancelled by user")
 
-        self._close_setup_window()
-        self.setup_in_progress = False
-        self._update_button_states()
-        self._update_status("Setup cancelled")
+        self._finish_setup_session("Setup cancelled")
 
     def _disable_window_detection(self) -> None:
         """Disable window detection for setup."""
@@ -717,10 +1014,9 @@ class RevolutionIdleGUI:
         self._log_message("Debug mode enabled for this setup session")
 
     def _close_setup_window(self) -> None:
-        """Close the setup instructions window."""
+        """Hide the setup instructions window, keeping it for the next session."""
         if self.setup_window:
-            self.setup_window.close()
-            self.setup_window = None
+            self.setup_window.hide()
 
     def _on_automation_click(self) -> None:
         """Handle automation button click."""
@@ -734,8 +1030,12 @@ class RevolutionIdleGUI:
         if self.is_automation_running:
             return
 
-        self.is_automation_running = True
-        self._update_button_states()
+        # on_press ignores keys while the stop flag is set, so clear the
+        # previous run's flag or the stop hotkey stays dead (the CLI path
+        # already does this before each run)
+        self.keyboard_handler.reset_stop_flag()
+        self._stop_event.clear()
+        self._request_button_refresh()
         self._update_status("Automation running")
         self._log_message("Starting automation...")
         self._log_message("Switch to the game window within 3 seconds...")
@@ -743,47 +1043,39 @@ class RevolutionIdleGUI:
         # Start keyboard listener for stopping automation
         self._start_automation_keyboard_listener()
 
-        # Run automation in a separate thread
-        self.automation_thread = threading.Thread(target=self._run_automation_thread)
-        self.automation_thread.daemon = True
-        self.automation_thread.start()
+        # Run automation on the worker pool
+        self.automation_future = self._executor.submit(self._run_automation_thread)
 
     def _run_automation_thread(self) -> None:
         """Run automation in a separate thread."""
         try:
-            # Define a stop callback that checks if automation should stop
-            def stop_callback() -> bool:
-                return not self.is_automation_running
-
             # Start automation with delay to allow switching to game window
             time.sleep(3)
             self.automation_engine.run_automation(
                 self.config_manager.click_coords,
                 self.config_manager.target_rgbs,
-                stop_callback,
+                self._stop_event.is_set,
             )
 
             # Update GUI after automation completion
-            if self.root:
-                self.root.after(0, self._on_automation_stopped)
+            self._post(self._on_automation_stopped)
 
         except Exception as e:  # pylint: disable=broad-except
-            if self.root:
-                self.root.after(0, lambda err=str(e): self._on_automation_error(err))
+            self._post(partial(self._on_automation_error, str(e)))
 
     def _stop_automation(self) -> None:
         """Stop the automation process."""
         if not self.is_automation_running:
             return
 
-        self.is_automation_running = False
+        self._stop_event.set()
         self._update_status("Stopping automation...")
         self._log_message("Stopping automation...")
 
     def _on_stop_automation(self) -> None:
         """Handle stop automation callback from keyboard handler."""
-        if self.is_automation_running and self.root:
-            self.root.after(0, self._on_keyboard_stop_automation)
+        if self.is_automation_running:
+            self._post(self._on_keyboard_stop_automation)
 
     def _on_keyboard_stop_automation(self) -> None:
         """Handle keyboard stop automation event."""
@@ -792,16 +1084,16 @@ class RevolutionIdleGUI:
 
     def _on_automation_stopped(self) -> None:
         """Handle automation stopped event."""
-        self.is_automation_running = False
-        self._update_button_states()
+        self._stop_event.set()
+        self._request_button_refresh()
         self._update_status("Automation stopped")
         self._log_message("Automation stopped")
         self._stop_automation_keyboard_listener()
 
     def _on_automation_error(self, error_msg: str) -> None:
         """Handle automation error."""
-        self.is_automation_running = False
-        self._update_button_states()
+        self._stop_event.set()
+        self._request_button_refresh()
         self._update_status("Automation error")
         self._log_message(f"Automation error: {error_msg}")
         self._stop_automation_keyboard_listener()
@@ -821,6 +1113,7 @@ class RevolutionIdleGUI:
                 self.config_manager.config_data["active_mode"] = mode
 
                 # Save the configuration with the new mode
+                self._invalidate_config_cache()
                 if self.config_manager.save_config(mode):
                     self._log_message(f"Mode switched to: {mode.title()}")
                     logger.info("User switched to %s mode", mode)
@@ -828,7 +1121,7 @@ class RevolutionIdleGUI:
                     self._log_message("Failed to save mode preference")
                     logger.error("Failed to save mode preference")
 
-                self._update_button_states()
+                self._request_button_refresh()
         except (AttributeError, ValueError) as e:
             logger.error("Error handling mode toggle: %s", e, exc_info=True)
             self._log_message("Error switching modes")
@@ -875,7 +1168,7 @@ class RevolutionIdleGUI:
 
             # Error message label
             label = ctk.CTkLabel(
-                error_window, text=message, wraplength=400, font=ctk.CTkFont(size=12)
+                error_window, text=message, wraplength=400, font=self._fonts["body"]
             )
             label.pack(pady=20, padx=20, expand=True)
 
@@ -888,11 +1181,12 @@ class RevolutionIdleGUI:
             logger.debug("Error dialog shown: %s", title)
 
     def _show_help_window(self) -> None:
-        """Show the help window."""
+        """Show the help window, building it only on first open."""
         if self.root:
-            # Store the window instance to prevent it from being garbage collected
-            # The window will be automatically destroyed when the user closes it
-            HelpWindow(self.root)  # Window manages its own lifecycle
+            if self.help_window is None:
+                self.help_window = HelpWindow(self.root)
+            else:
+                self.help_window.show()
 
     def _on_settings_click(self) -> None:
         """Open the settings window."""
@@ -904,8 +1198,23 @@ class RevolutionIdleGUI:
             )
             logger.debug("Settings window opened")
 
+    def _on_app_close(self) -> None:
+        """Handle the main window being closed."""
+        logger.info("Application closing")
+        # Executor workers are non-daemon and get joined at interpreter
+        # exit, so any running automation or setup loop must be told to
+        # stop or closing the window mid-run hangs the process
+        self._stop_event.set()
+        if self.setup_in_progress:
+            self.setup_manager.cancel_setup()
+        self._shutdown_listeners()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self.root:
+            self.root.destroy()
+
     def _on_settings_saved(self) -> None:
         """Handle settings saved event."""
         logger.debug("Settings saved callback triggered")
+        self._invalidate_config_cache()
         self._log_message("Settings saved and reloaded.")
         self.settings_window = None
@@ -7,7 +7,9 @@ to assist users in understanding how to use the application.
 
 import logging
 import os
-from typing import Any, Optional
+import subprocess
+import sys
+from typing import Any, Dict, Optional, Tuple
 
 import customtkinter as ctk
 from .window_utils import WindowPositioner
@@ -16,6 +18,7 @@ from src.gui.utils import (
     create_info_label,
     create_scrollable_frame,
     create_section_header,
+    get_shared_font,
     open_url,
 )
 
@@ -23,6 +26,181 @@ from src.gui.utils import (
 logger = logging.getLogger(__name__)
 
 
+# Platform dispatch for opening a file with its default application,
+# resolved once at import instead of branching per click. Popen is used on
+# the POSIX paths so the UI thread never waits on the spawned editor.
+if sys.platform == "win32":
+
+    def _open_with_default_app(path: str) -> None:
+        """Open a file with the platform's default application."""
+        os.startfile(path)  # pylint: disable=no-member
+
+elif sys.platform == "darwin":
+
+    def _open_with_default_app(path: str) -> None:
+        """Open a file with the platform's default application."""
+        # Fire-and-forget: waiting on the child would block the Tk thread
+        subprocess.Popen(["open", path])  # pylint: disable=consider-using-with
+
+else:
+
+    def _open_with_default_app(path: str) -> None:
+        """Open a file with the platform's default application."""
+        # Fire-and-forget: waiting on the child would block the Tk thread
+        subprocess.Popen(["xdg-open", path])  # pylint: disable=consider-using-with
+
+# Declarative help content: tab name -> ((section header, body), ...).
+# Built once at import time (STOP_KEY interpolations included), so showing
+# a tab is pure widget construction with no per-open string assembly.
+_HELP_SECTIONS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "Overview": (
+        (
+            "Revolution Idle Sacrifice Automation",
+            "This application automates the zodiac sacrificing process in the game "
+            "'Revolution Idle'. It operates in two modes: 'setup' to configure the necessary "
+            "click points and colors, and 'automation' to perform the repetitive actions.",
+        ),
+        (
+            "How It Works",
+            "1. Checks the colors of all configured zodiac slots in each cycle.\n"
+            "2. When any zodiac slot's color matches its target, drags that zodiac to the sacrifice box.\n"
+            "3. After the drag, it checks the color of the sacrifice button.\n"
+            "4. If the sacrifice button's color matches, it clicks the button and restarts the sequence.",
+        ),
+        (
+            "Important Notes",
+            "• You can configure multiple zodiac slots during setup.\n"
+            "• For consistent automation, it is recommended to auto-sell other zodiac rarities.\n"
+            "• The sacrifice button's target color is hardcoded to ensure reliability.",
+        ),
+        (
+            "Controls",
+            f"• Press {STOP_KEY.upper()} to stop automation at any time.\n"
+            "• Use the Setup Mode button to configure the automation.\n"
+            "• Use the Start Automation button to begin the process.",
+        ),
+    ),
+    "Setup": (
+        (
+            "Setup Mode",
+            "Setup mode allows you to configure the positions and colors needed for automation. "
+            "Follow the on-screen instructions during setup.",
+        ),
+        (
+            "Setup Process",
+            "1. Click on the 'Setup Mode' button to start.\n"
+            "2. Follow the instructions to click on each zodiac slot.\n"
+            "3. Click on the sacrifice drag box.\n"
+            "4. Click on the sacrifice button.\n"
+            "5. The setup will save automatically when complete.",
+        ),
+        (
+            "Tips for Setup",
+            "• Make sure the game window is visible during setup.\n"
+            "• Position zodiacs of the desired type in the slots before setup.\n"
+            "• For best results, configure the game to show only the zodiac type you want to sacrifice.",
+        ),
+        (
+            "Window Detection",
+            "By default, the application tries to detect the game window. If this causes issues, "
+            "you can disable window detection during setup using the 'Disable Window Detection' button.",
+        ),
+    ),
+    "Automation": (
+        (
+            "Automation Mode",
+            "Automation mode performs the repetitive actions of checking zodiac slots, "
+            "dragging matching zodiacs to the sacrifice box, and clicking the sacrifice button.",
+        ),
+        (
+            "Starting Automation",
+            "1. Complete setup mode first.\n"
+            "2. Click the 'Start Automation' button.\n"
+            "3. Switch to the game window within 3 seconds.\n"
+            "4. The automation will begin checking zodiac slots and performing sacrifices.",
+        ),
+        (
+            "Stopping Automation",
+            f"• Press {STOP_KEY.upper()} to stop automation at any time.\n"
+            "• Click the 'Stop Automation' button.\n"
+            "• Close the application window.",
+        ),
+        (
+            "Troubleshooting",
+            "If automation is not working correctly:\n"
+            "• Make sure the game window is visible and not minimized.\n"
+            "• Check that the game hasn't changed visually since setup.\n"
+            "• Try running setup again to reconfigure the positions and colors.",
+        ),
+    ),
+    "Settings": (
+        (
+            "Settings",
+            "Settings are stored in the user_settings.json file. You can modify these settings "
+            "to customize the behavior of the automation.",
+        ),
+        (
+            "Important Settings",
+            "• MAX_ZODIAC_SLOTS: Maximum number of zodiac slots to configure.\n"
+            "• DELAY_AFTER_CLICK: Delay between clicks (in seconds).\n"
+            "• DELAY_DRAG_DURATION: Duration of drag operations (in seconds).\n"
+            "• COLOR_TOLERANCE: Tolerance for color matching (0-255).",
+        ),
+        (
+            "Advanced Settings",
+            "• STOP_KEY: Key to press to stop automation.\n"
+            "• DEBUG_COLOR_MATCHING: Enable/disable debug color matching.\n"
+            "• MESSAGE_LEVEL: Control verbosity of messages ('info' or 'debug').",
+        ),
+        (
+            "Reloading Settings",
+            "After modifying settings, click the 'Reload Settings' button in the main window "
+            "to apply the changes without restarting the application.",
+        ),
+    ),
+    "Performance": (
+        (
+            "Performance Information",
+            "Based on testing, the script can achieve approximately 230 sacrifices per minute "
+            "with 1 slot configured and the fastest possible timing settings.",
+        ),
+        (
+            "Factors Affecting Performance",
+            "• Number of configured zodiac slots (more slots may reduce per-slot efficiency).\n"
+            "• Timing settings (DELAY_AFTER_CLICK, DELAY_DRAG_DURATION, etc.).\n"
+            "• Computer performance and game responsiveness.\n"
+            "• Game progression and visual elements.",
+        ),
+        (
+            "Optimization Tips",
+            "• Configure only the zodiac slots you need for your strategy.\n"
+            "• Experiment with timing settings to find the fastest reliable values.\n"
+            "• Close unnecessary applications to improve performance.\n"
+            "• Ensure the game is running smoothly before starting automation.",
+        ),
+    ),
+    "About": (
+        (
+            "About",
+            "Revolution Idle Sacrifice Automation is a tool designed to automate "
+            "the repetitive process of zodiac sacrificing in the game Revolution Idle.",
+        ),
+        (
+            "Author",
+            "Created by RLAlpha49\nGitHub: https://github.com/RLAlpha49",
+        ),
+        (
+            "Repository",
+            "GitHub Repository: https://github.com/RLAlpha49/Revolution-Idle-Sacrifice-Automation",
+        ),
+        (
+            "License",
+            "This project is licensed under the MIT License. See the LICENSE file for details.",
+        ),
+    ),
+}
+
+
 class HelpWindow:
     """Help window with tabbed information about using the application."""
 
@@ -31,6 +209,10 @@ class HelpWindow:
         try:
             self.parent = parent
             self.window: Optional[ctk.CTkToplevel] = None
+            self.tabview: Optional[ctk.CTkTabview] = None
+            # Tab content is built lazily on first selection; most users
+            # only ever open one or two tabs
+            self._built_tabs: set = set()
             self._create_window()
             logger.debug("Help window initialized")
         except Exception:  # pylint: disable=broad-except
@@ -54,29 +236,18 @@ class HelpWindow:
             title_label = ctk.CTkLabel(
                 main_frame,
                 text="Revolution Idle Sacrifice Automation - Help",
-                font=ctk.CTkFont(size=20, weight="bold"),
+                font=get_shared_font(20, "bold"),
             )
             title_label.pack(pady=(0, 20))
 
-            # Create tabview
-            tabview = ctk.CTkTabview(main_frame)
-            tabview.pack(fill="both", expand=True)
-
-            # Create tabs
-            overview_tab = tabview.add("Overview")
-            setup_tab = tabview.add("Setup")
-            automation_tab = tabview.add("Automation")
-            settings_tab = tabview.add("Settings")
-            performance_tab = tabview.add("Performance")
-            about_tab = tabview.add("About")
-
-            # Populate tabs
-            self._create_overview_tab(overview_tab)
-            self._create_setup_tab(setup_tab)
-            self._create_automation_tab(automation_tab)
-            self._create_settings_tab(settings_tab)
-            self._create_performance_tab(performance_tab)
-            self._create_about_tab(about_tab)
+            # Create tabview; content is populated on first selection
+            self.tabview = ctk.CTkTabview(main_frame, command=self._on_tab_selected)
+            self.tabview.pack(fill="both", expand=True)
+
+            # Create empty tab containers (needed so the selector shows
+            # every tab); the widget-heavy content waits for selection
+            for tab_name in _HELP_SECTIONS:
+                self.tabview.add(tab_name)
 
             # Create bottom buttons frame
             button_frame = ctk.CTkFrame(main_frame)
@@ -106,13 +277,18 @@ class HelpWindow:
             close_button = ctk.CTkButton(
                 button_container,
                 text="Close",
-                command=self.window.destroy,
+                command=self.hide,
                 width=100,
             )
             close_button.pack(side="right", padx=10)
 
-            # Set default tab
-            tabview.set("Overview")
+            # Hide instead of destroying so reopening is a cheap deiconify
+            # rather than a full widget-tree rebuild
+            self.window.protocol("WM_DELETE_WINDOW", self.hide)
+
+            # Set default tab and build only its content
+            self.tabview.set("Overview")
+            self._ensure_tab_built("Overview")
 
             logger.debug("Help window created")
         except Exception:  # pylint: disable=broad-except
@@ -120,292 +296,66 @@ class HelpWindow:
             if self.window:
                 self.window.destroy()
 
-    def _create_overview_tab(self, parent: Any) -> None:
-        """Create the overview tab content."""
-        try:
-            scrollable_frame, content_frame = create_scrollable_frame(parent)
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-            create_section_header(
-                content_frame, "Revolution Idle Sacrifice Automation"
-            ).pack(anchor="w", pady=(15, 5), padx=10)
-            create_info_label(
-                content_frame,
-                "This application automates the zodiac sacrificing process in the game "
-                "'Revolution Idle'. It operates in two modes: 'setup' to configure the necessary "
-                "click points and colors, and 'automation' to perform the repetitive actions.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "How It Works").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "1. Checks the colors of all configured zodiac slots in each cycle.\n"
-                "2. When any zodiac slot's color matches its target, drags that zodiac to the sacrifice box.\n"
-                "3. After the drag, it checks the color of the sacrifice button.\n"
-                "4. If the sacrifice button's color matches, it clicks the button and restarts the sequence.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            # Important notes
-            create_section_header(content_frame, "Important Notes").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "• You can configure multiple zodiac slots during setup.\n"
-                "• For consistent automation, it is recommended to auto-sell other zodiac rarities.\n"
-                "• The sacrifice button's target color is hardcoded to ensure reliability.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            # Controls
-            create_section_header(content_frame, "Controls").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                f"• Press {STOP_KEY.upper()} to stop automation at any time.\n"
-                "• Use the Setup Mode button to configure the automation.\n"
-                "• Use the Start Automation button to begin the process.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            logger.debug("Overview tab created successfully")
-        except Exception:  # pylint: disable=broad-except
-            logger.error("Error creating overview tab", exc_info=True)
-
-    def _create_setup_tab(self, parent: Any) -> None:
-        """Create the setup tab content."""
-        try:
-            scrollable_frame, content_frame = create_scrollable_frame(parent)
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-            create_section_header(content_frame, "Setup Mode").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "Setup mode allows you to configure the positions and colors needed for automation. "
-                "Follow the on-screen instructions during setup.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Setup Process").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "1. Click on the 'Setup Mode' button to start.\n"
-                "2. Follow the instructions to click on each zodiac slot.\n"
-                "3. Click on the sacrifice drag box.\n"
-                "4. Click on the sacrifice button.\n"
-                "5. The setup will save automatically when complete.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Tips for Setup").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "• Make sure the game window is visible during setup.\n"
-                "• Position zodiacs of the desired type in the slots before setup.\n"
-                "• For best results, configure the game to show only the zodiac type you want to sacrifice.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Window Detection").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "By default, the application tries to detect the game window. If this causes issues, "
-                "you can disable window detection during setup using the 'Disable Window Detection' button.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            logger.debug("Setup tab created successfully")
-        except Exception:  # pylint: disable=broad-except
-            logger.error("Error creating setup tab", exc_info=True)
-
-    def _create_automation_tab(self, parent: Any) -> None:
-        """Create the automation tab content."""
-        try:
-            scrollable_frame, content_frame = create_scrollable_frame(parent)
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-            create_section_header(content_frame, "Automation Mode").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "Automation mode performs the repetitive actions of checking zodiac slots, "
-                "dragging matching zodiacs to the sacrifice box, and clicking the sacrifice button.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Starting Automation").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "1. Complete setup mode first.\n"
-                "2. Click the 'Start Automation' button.\n"
-                "3. Switch to the game window within 3 seconds.\n"
-                "4. The automation will begin checking zodiac slots and performing sacrifices.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Stopping Automation").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                f"• Press {STOP_KEY.upper()} to stop automation at any time.\n"
-                "• Click the 'Stop Automation' button.\n"
-                "• Close the application window.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Troubleshooting").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "If automation is not working correctly:\n"
-                "• Make sure the game window is visible and not minimized.\n"
-                "• Check that the game hasn't changed visually since setup.\n"
-                "• Try running setup again to reconfigure the positions and colors.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            logger.debug("Automation tab created successfully")
-        except Exception:  # pylint: disable=broad-except
-            logger.error("Error creating automation tab", exc_info=True)
-
-    def _create_settings_tab(self, parent: Any) -> None:
-        """Create the settings tab content."""
+    def _on_tab_selected(self) -> None:
+        """Build the newly selected tab's content on first visit."""
+        if self.tabview:
+            self._ensure_tab_built(self.tabview.get())
+
+    def _ensure_tab_built(self, tab_name: str) -> None:
+        """Populate a tab's widgets the first time it is selected.
+
+        Args:
+            tab_name: Name of the tab to build
+        """
+        if tab_name in self._built_tabs or self.tabview is None:
+            return
+
+        sections = _HELP_SECTIONS.get(tab_name)
+        if sections:
+            self._build_tab(self.tabview.tab(tab_name), sections)
+            self._built_tabs.add(tab_name)
+            logger.debug("%s tab created successfully", tab_name)
+
+    def _build_tab(self, parent: Any, sections: Tuple[Tuple[str, str], ...]) -> None:
+        """Populate a tab from its declarative (header, body) sections.
+
+        Args:
+            parent: Tab container frame
+            sections: Ordered section header/body pairs for this tab
+        """
         try:
             scrollable_frame, content_frame = create_scrollable_frame(parent)
             scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-            create_section_header(content_frame, "Settings").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "Settings are stored in the user_settings.json file. You can modify these settings "
-                "to customize the behavior of the automation.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Important Settings").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "• MAX_ZODIAC_SLOTS: Maximum number of zodiac slots to configure.\n"
-                "• DELAY_AFTER_CLICK: Delay between clicks (in seconds).\n"
-                "• DELAY_DRAG_DURATION: Duration of drag operations (in seconds).\n"
-                "• COLOR_TOLERANCE: Tolerance for color matching (0-255).",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Advanced Settings").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "• STOP_KEY: Key to press to stop automation.\n"
-                "• DEBUG_COLOR_MATCHING: Enable/disable debug color matching.\n"
-                "• MESSAGE_LEVEL: Control verbosity of messages ('info' or 'debug').",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Reloading Settings").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "After modifying settings, click the 'Reload Settings' button in the main window "
-                "to apply the changes without restarting the application.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            logger.debug("Settings tab created successfully")
+            for header, body in sections:
+                create_section_header(content_frame, header).pack(
+                    anchor="w", pady=(15, 5), padx=10
+                )
+                create_info_label(content_frame, body).pack(
+                    anchor="w", pady=(0, 10), padx=20
+                )
         except Exception:  # pylint: disable=broad-except
-            logger.error("Error creating settings tab", exc_info=True)
+            logger.error("Error creating help tab content", exc_info=True)
 
-    def _create_performance_tab(self, parent: Any) -> None:
-        """Create the performance tab content."""
+    def show(self) -> None:
+        """Show the help window, raising it above other windows."""
         try:
-            scrollable_frame, content_frame = create_scrollable_frame(parent)
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-            create_section_header(content_frame, "Performance Information").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "Based on testing, the script can achieve approximately 230 sacrifices per minute "
-                "with 1 slot configured and the fastest possible timing settings.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Factors Affecting Performance").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "• Number of configured zodiac slots (more slots may reduce per-slot efficiency).\n"
-                "• Timing settings (DELAY_AFTER_CLICK, DELAY_DRAG_DURATION, etc.).\n"
-                "• Computer performance and game responsiveness.\n"
-                "• Game progression and visual elements.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Optimization Tips").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "• Configure only the zodiac slots you need for your strategy.\n"
-                "• Experiment with timing settings to find the fastest reliable values.\n"
-                "• Close unnecessary applications to improve performance.\n"
-                "• Ensure the game is running smoothly before starting automation.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            logger.debug("Performance tab created successfully")
+            if self.window:
+                self.window.deiconify()
+                self.window.lift()
+                self.window.focus_set()
+                logger.debug("Help window shown")
         except Exception:  # pylint: disable=broad-except
-            logger.error("Error creating performance tab", exc_info=True)
+            logger.error("Error showing help window", exc_info=True)
 
-    def _create_about_tab(self, parent: Any) -> None:
-        """Create the about tab content."""
+    def hide(self) -> None:
+        """Hide the help window without destroying it."""
         try:
-            scrollable_frame, content_frame = create_scrollable_frame(parent)
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-            create_section_header(content_frame, "About").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "Revolution Idle Sacrifice Automation is a tool designed to automate "
-                "the repetitive process of zodiac sacrificing in the game Revolution Idle.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Author").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "Created by RLAlpha49\nGitHub: https://github.com/RLAlpha49",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "Repository").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "GitHub Repository: https://github.com/RLAlpha49/Revolution-Idle-Sacrifice-Automation",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            create_section_header(content_frame, "License").pack(
-                anchor="w", pady=(15, 5), padx=10
-            )
-            create_info_label(
-                content_frame,
-                "This project is licensed under the MIT License. See the LICENSE file for details.",
-            ).pack(anchor="w", pady=(0, 10), padx=20)
-
-            logger.debug("About tab created successfully")
+            if self.window:
+                self.window.withdraw()
+                logger.debug("Help window hidden")
         except Exception:  # pylint: disable=broad-except
-            logger.error("Error creating about tab", exc_info=True)
+            logger.error("Error hiding help window", exc_info=True)
 
     def _open_github_repo(self) -> None:
         """Open the GitHub repository in the default web browser."""
@@ -417,9 +367,6 @@ class HelpWindow:
         """Open the settings file in the default text editor."""
         try:
             # Get the settings file path
-            import subprocess  # pylint: disable=import-outside-toplevel
-            import sys  # pylint: disable=import-outside-toplevel
-
             if hasattr(sys, "_MEIPASS"):
                 # Running as compiled executable
                 base_dir = os.path.dirname(sys.executable)
@@ -433,12 +380,7 @@ class HelpWindow:
 
             # Open the file with the default application
             if os.path.exists(settings_file):
-                if sys.platform == "win32":
-                    os.startfile(settings_file)  # pylint: disable=no-member
-                elif sys.platform == "darwin":  # macOS
-                    subprocess.run(["open", settings_file], check=True)
-                else:  # Linux
-                    subprocess.run(["xdg-open", settings_file], check=True)
+                _open_with_default_app(settings_file)
                 logger.info("Opening settings file: %s", settings_file)
             else:
                 logger.warning("Settings file not found: %s", settings_file)
@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import sys
+import threading
 from typing import Any, Dict, Optional, Callable, List, Tuple
 
 import customtkinter as ctk  # type: ignore
@@ -580,36 +581,57 @@ class SettingsWindow:
                             "GUI scale changed from %s to %s", original_scale, new_scale
                         )
 
-            # Save to file
+            # Write and reload off the Tk thread - both hit the filesystem
+            # and would otherwise block the event loop inside this callback
             settings_file = self._get_settings_file_path()
-            with open(settings_file, "w", encoding="utf-8") as f:
-                json.dump(updated_settings, f, indent=4)
 
-            logger.info("Settings saved to %s", settings_file)
+            def _write_and_reload() -> None:
+                try:
+                    with open(settings_file, "w", encoding="utf-8") as f:
+                        json.dump(updated_settings, f, indent=4)
 
-            # Reload settings in the application
-            reload_settings()
+                    logger.info("Settings saved to %s", settings_file)
 
-            # Call callback if provided
-            if self.on_settings_saved:
-                self.on_settings_saved()
+                    # Reload settings in the application
+                    reload_settings()
 
-            # Show success message with restart notice if scale changed
-            if scale_changed:
-                self._show_message(
-                    "Settings saved successfully!\n\nYou changed the GUI scale factor. "
-                    "Please restart the application for this change to take effect.",
-                    title="Restart Required",
-                )
-            else:
-                self._show_message("Settings saved successfully!")
+                    if self.window:
+                        self.window.after(0, self._on_save_finished, scale_changed)
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.error("Error saving settings: %s", e, exc_info=True)
+                    if self.window:
+                        self.window.after(0, self._on_save_failed, str(e))
 
-            # Close window
-            self._close_window()
+            threading.Thread(
+                target=_write_and_reload, name="settings-save", daemon=True
+            ).start()
         except Exception as e:
             logger.error("Error saving settings: %s", e, exc_info=True)
             self._show_message(f"Error saving settings: {e}", error=True)
 
+    def _on_save_finished(self, scale_changed: bool) -> None:
+        """Finish a successful save back on the Tk thread."""
+        # Call callback if provided
+        if self.on_settings_saved:
+            self.on_settings_saved()
+
+        # Show success message with restart notice if scale changed
+        if scale_changed:
+            self._show_message(
+                "Settings saved successfully!\n\nYou changed the GUI scale factor. "
+                "Please restart the application for this change to take effect.",
+                title="Restart Required",
+            )
+        else:
+            self._show_message("Settings saved successfully!")
+
+        # Close window
+        self._close_window()
+
+    def _on_save_failed(self, error_msg: str) -> None:
+        """Report a failed save back on the Tk thread."""
+        self._show_message(f"Error saving settings: {error_msg}", error=True)
+
     def _show_message(
         self, message: str, error: bool = False, title: str = "Message"
     ) -> None:
@@ -220,6 +220,47 @@ class SetupInstructionsWindow:
                 "Error updating disable detection button: %s", e, exc_info=True
             )
 
+    def show(self) -> None:
+        """Show the window again for a new setup session, resetting its state."""
+        logger.debug("Showing setup instructions window for new session")
+        if self.window is None:
+            self._create_window()
+            return
+
+        try:
+            # Reset per-session state so the reused widget tree starts fresh
+            self.window_detection_disabled = False
+            if self.instructions_label:
+                self.instructions_label.configure(
+                    text="Follow the on-screen instructions to set up automation."
+                )
+            if self.debug_mode_button:
+                self.debug_mode_button.configure(
+                    text="Enable Debug Mode",
+                    state="normal",
+                    fg_color=("#3B8ED0", "#1F6AA5"),
+                )
+            if self.disable_detection_button:
+                self.disable_detection_button.configure(
+                    text="Disable Window Detection",
+                    state="normal",
+                    fg_color=("#3B8ED0", "#1F6AA5"),
+                )
+
+            self.window.deiconify()
+            self.window.lift()
+        except (AttributeError, ValueError, RuntimeError) as e:
+            logger.error("Error showing setup window: %s", e, exc_info=True)
+
+    def hide(self) -> None:
+        """Hide the window without destroying it, keeping the widget tree warm."""
+        logger.debug("Hiding setup instructions window")
+        if self.window:
+            try:
+                self.window.withdraw()
+            except (AttributeError, RuntimeError) as e:
+                logger.error("Error hiding setup window: %s", e, exc_info=True)
+
     def close(self) -> None:
         """Close the setup instructions window."""
         logger.debug("Closing setup instructions window")
@@ -7,13 +7,40 @@ This module provides helper functions for GUI-related tasks.
 import logging
 import time
 import webbrowser
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import customtkinter as ctk  # type: ignore
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+# Shared CTkFont instances keyed by (size, weight). Each CTkFont registers
+# a named Tk font, so helpers reuse one object per style instead of
+# creating a new font for every label they build.
+_FONT_CACHE: Dict[Tuple[int, Optional[str]], ctk.CTkFont] = {}
+
+
+def get_shared_font(size: int, weight: Optional[str] = None) -> ctk.CTkFont:
+    """
+    Get a cached CTkFont for the given style, creating it on first use.
+
+    Args:
+        size: Font size in points
+        weight: Optional font weight (e.g. "bold")
+
+    Returns:
+        The shared font instance for this style
+    """
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        if weight:
+            font = ctk.CTkFont(size=size, weight=weight)
+        else:
+            font = ctk.CTkFont(size=size)
+        _FONT_CACHE[key] = font
+    return font
+
 
 def open_url(url: str) -> None:
     """
@@ -109,7 +136,7 @@ def create_section_header(parent: ctk.CTkFrame, text: str) -> ctk.CTkLabel:
         header = ctk.CTkLabel(
             parent,
             text=text,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_shared_font(16, "bold"),
         )
         header.pack(anchor="w", pady=(15, 5), padx=10)
 
@@ -136,7 +163,7 @@ def create_info_label(parent: ctk.CTkFrame, text: str) -> ctk.CTkLabel:
         label = ctk.CTkLabel(
             parent,
             text=text,
-            font=ctk.CTkFont(size=12),
+            font=get_shared_font(12),
             justify="left",
             wraplength=600,
         )
@@ -5,26 +5,197 @@ This module provides utilities for positioning windows relative to a parent wind
 or main application window, with proper multi-monitor support.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Optional, Tuple, Union, Dict
-import customtkinter as ctk
-import tkinter as tk
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple, Union, Dict
+
+if TYPE_CHECKING:
+    # Only needed for annotations - importing customtkinter eagerly pulls in
+    # themes, fonts and Tcl files, which slows down every module that
+    # transitively imports this one
+    import customtkinter as ctk
 
 logger = logging.getLogger(__name__)
 
 
+def _set_dpi_awareness() -> None:
+    """Opt the process into per-monitor DPI awareness on Windows.
+
+    Without this, winfo_screenwidth()-based queries return virtualized
+    sizes on HiDPI multi-monitor setups, mis-positioning dialogs. Must run
+    before any window is created, hence at module import.
+    """
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes  # pylint: disable=import-outside-toplevel
+
+        try:
+            # Windows 10 1703+: DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2
+            ctypes.windll.user32.SetProcessDpiAwarenessContext(-4)
+            logger.debug("Per-monitor DPI awareness (v2) enabled")
+        except (AttributeError, OSError):
+            try:
+                # Windows 8.1+: PROCESS_PER_MONITOR_DPI_AWARE
+                ctypes.windll.shcore.SetProcessDpiAwareness(2)
+                logger.debug("Per-monitor DPI awareness enabled")
+            except (AttributeError, OSError):
+                # Vista+: system DPI awareness as a last resort
+                ctypes.windll.user32.SetProcessDPIAware()
+                logger.debug("System DPI awareness enabled")
+    except (AttributeError, OSError) as e:
+        logger.warning("Could not set DPI awareness: %s", e)
+
+
+_set_dpi_awareness()
+
+
+@dataclass(slots=True, frozen=True)
+class MonitorInfo:
+    """Window position plus bounds of the monitor and virtual screen containing it.
+
+    A single immutable object replaces the dict previously allocated per
+    lookup; attribute access is cheaper than string-keyed dict access and
+    the instance can be passed between helpers without re-copying fields.
+    """
+
+    window_x: int
+    window_y: int
+    window_width: int
+    window_height: int
+    monitor_x: int
+    monitor_y: int
+    monitor_width: int
+    monitor_height: int
+    virtual_x: int
+    virtual_y: int
+    virtual_width: int
+    virtual_height: int
+    # Effective scale of the monitor (1.0 = 96 DPI), for callers that need
+    # to compensate for Tk's per-monitor scaling
+    dpi_scale: float = 1.0
+
+
+class MonitorRect(NamedTuple):
+    """Bounding rectangle of a single physical monitor in virtual-screen coordinates."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    dpi: int = 96
+
+    def contains(self, px: int, py: int) -> bool:
+        """Check whether a point lies within this monitor's bounds."""
+        return (
+            self.x <= px < self.x + self.width and self.y <= py < self.y + self.height
+        )
+
+
+# Cached monitor rectangles - enumerated once and reused for every lookup
+_monitor_rects: Optional[List[MonitorRect]] = None
+
+
+def _enumerate_monitors(window: Union[ctk.CTk, ctk.CTkToplevel]) -> List[MonitorRect]:
+    """Enumerate all monitor rectangles.
+
+    On Windows this uses EnumDisplayMonitors for accurate per-monitor bounds.
+    On other platforms (or on failure) it falls back to treating the primary
+    screen reported by Tk as a single monitor.
+
+    Args:
+        window: Any Tk window, used for the fallback screen-size query
+
+    Returns:
+        List of MonitorRect entries, never empty
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes  # pylint: disable=import-outside-toplevel
+            import ctypes.wintypes  # pylint: disable=import-outside-toplevel
+
+            rects: List[MonitorRect] = []
+
+            monitor_enum_proc = ctypes.WINFUNCTYPE(
+                ctypes.c_int,
+                ctypes.wintypes.HMONITOR,
+                ctypes.wintypes.HDC,
+                ctypes.POINTER(ctypes.wintypes.RECT),
+                ctypes.wintypes.LPARAM,
+            )
+
+            def _query_dpi(hmonitor) -> int:
+                """Get the effective DPI of a monitor, defaulting to 96."""
+                try:
+                    dpi_x = ctypes.wintypes.UINT()
+                    dpi_y = ctypes.wintypes.UINT()
+                    # MDT_EFFECTIVE_DPI = 0
+                    ctypes.windll.shcore.GetDpiForMonitor(
+                        hmonitor, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y)
+                    )
+                    return dpi_x.value or 96
+                except (AttributeError, OSError):
+                    return 96
+
+            def _callback(hmonitor, _hdc, lprect, _lparam) -> int:
+                rect = lprect.contents
+                rects.append(
+                    MonitorRect(
+                        rect.left,
+                        rect.top,
+                        rect.right - rect.left,
+                        rect.bottom - rect.top,
+                        _query_dpi(hmonitor),
+                    )
+                )
+                return 1  # Continue enumeration
+
+            ctypes.windll.user32.EnumDisplayMonitors(
+                None, None, monitor_enum_proc(_callback), 0
+            )
+
+            if rects:
+                logger.debug("Enumerated %d monitor(s) via Win32 API", len(rects))
+                return rects
+        except (AttributeError, OSError) as e:
+            logger.warning("Win32 monitor enumeration failed: %s", e)
+
+    # Fallback: single monitor covering the primary screen
+    return [
+        MonitorRect(0, 0, window.winfo_screenwidth(), window.winfo_screenheight())
+    ]
+
+
+def _get_monitor_rects(window: Union[ctk.CTk, ctk.CTkToplevel]) -> List[MonitorRect]:
+    """Get the cached monitor rectangle list, enumerating on first use."""
+    global _monitor_rects  # pylint: disable=global-statement
+    if _monitor_rects is None:
+        _monitor_rects = _enumerate_monitors(window)
+    return _monitor_rects
+
+
+def refresh_monitor_cache() -> None:
+    """Invalidate the cached monitor list (e.g. after a display change)."""
+    global _monitor_rects  # pylint: disable=global-statement
+    _monitor_rects = None
+    logger.debug("Monitor cache invalidated")
+
+
 class WindowPositioner:
     """Utility class for positioning windows with multi-monitor support."""
 
     @staticmethod
-    def get_monitor_info(window: Union[ctk.CTk, ctk.CTkToplevel]) -> Dict[str, int]:
+    def get_monitor_info(window: Union[ctk.CTk, ctk.CTkToplevel]) -> MonitorInfo:
         """Get information about the monitor containing the window.
 
         Args:
             window: Window to get monitor info for
 
         Returns:
-            dict: Dictionary containing monitor bounds and window position
+            MonitorInfo: Monitor bounds and window position
         """
         try:
             window.update_idletasks()
@@ -37,147 +208,109 @@ class WindowPositioner:
 
             # Get all monitor information using tkinter's built-in methods
             # This works better for multi-monitor setups than winfo_screenwidth/height
+            # Deferred imports: by the time a window exists these modules are
+            # already loaded, so this is just a sys.modules lookup
+            import tkinter as tk  # pylint: disable=import-outside-toplevel
+            import customtkinter as ctk  # pylint: disable=import-outside-toplevel
+
             root = window if isinstance(window, ctk.CTk) else window.master
             if root is None:
                 root = tk._default_root or window
 
-            # Try to get monitor bounds using tkinter geometry methods
+            # Try to find the monitor containing the window center using the
+            # prebuilt monitor-rect list
             try:
-                # Get the geometry of the root window to determine monitor bounds
-                geometry = root.wm_maxsize()
-                max_width, max_height = geometry
-
-                # For multi-monitor, we need to detect which monitor the window is on
-                # Use the window's current position to determine monitor bounds
-
                 # Get virtual screen dimensions (all monitors combined)
                 virtual_width = root.winfo_vrootwidth()
                 virtual_height = root.winfo_vrootheight()
                 virtual_x = root.winfo_vrootx()
                 virtual_y = root.winfo_vrooty()
 
-                # Calculate monitor bounds based on window position
-                # This is a simplified approach - for more complex setups,
-                # we'd need platform-specific APIs
-
-                # Estimate monitor bounds by finding which "screen" the window center is in
+                # Find which monitor the window center is on
                 window_center_x = win_x + win_width // 2
                 window_center_y = win_y + win_height // 2
 
-                # Try to determine monitor bounds
-                # If window is in negative coordinates, it's likely on a secondary monitor
-                if window_center_x < 0:
-                    # Likely on a monitor to the left of primary
-                    monitor_x = virtual_x
-                    monitor_width = abs(virtual_x)
-                elif window_center_x > max_width:
-                    # Likely on a monitor to the right of primary
-                    monitor_x = max_width
-                    monitor_width = virtual_width - max_width
-                else:
-                    # On primary monitor
-                    monitor_x = 0
-                    monitor_width = max_width
-
-                if window_center_y < 0:
-                    # Likely on a monitor above primary
-                    monitor_y = virtual_y
-                    monitor_height = abs(virtual_y)
-                elif window_center_y > max_height:
-                    # Likely on a monitor below primary
-                    monitor_y = max_height
-                    monitor_height = virtual_height - max_height
-                else:
-                    # On primary monitor
-                    monitor_y = 0
-                    monitor_height = max_height
-
-                return {
-                    "window_x": win_x,
-                    "window_y": win_y,
-                    "window_width": win_width,
-                    "window_height": win_height,
-                    "monitor_x": monitor_x,
-                    "monitor_y": monitor_y,
-                    "monitor_width": monitor_width,
-                    "monitor_height": monitor_height,
-                    "virtual_x": virtual_x,
-                    "virtual_y": virtual_y,
-                    "virtual_width": virtual_width,
-                    "virtual_height": virtual_height,
-                }
+                rects = _get_monitor_rects(window)
+                monitor = next(
+                    (m for m in rects if m.contains(window_center_x, window_center_y)),
+                    rects[0],
+                )
+
+                return MonitorInfo(
+                    window_x=win_x,
+                    window_y=win_y,
+                    window_width=win_width,
+                    window_height=win_height,
+                    monitor_x=monitor.x,
+                    monitor_y=monitor.y,
+                    monitor_width=monitor.width,
+                    monitor_height=monitor.height,
+                    virtual_x=virtual_x,
+                    virtual_y=virtual_y,
+                    virtual_width=virtual_width,
+                    virtual_height=virtual_height,
+                    dpi_scale=monitor.dpi / 96.0,
+                )
 
             except (AttributeError, ValueError, TypeError):
                 # Fallback to basic screen dimensions
                 screen_width = window.winfo_screenwidth()
                 screen_height = window.winfo_screenheight()
 
-                return {
-                    "window_x": win_x,
-                    "window_y": win_y,
-                    "window_width": win_width,
-                    "window_height": win_height,
-                    "monitor_x": 0,
-                    "monitor_y": 0,
-                    "monitor_width": screen_width,
-                    "monitor_height": screen_height,
-                    "virtual_x": 0,
-                    "virtual_y": 0,
-                    "virtual_width": screen_width,
-                    "virtual_height": screen_height,
-                }
+                return MonitorInfo(
+                    window_x=win_x,
+                    window_y=win_y,
+                    window_width=win_width,
+                    window_height=win_height,
+                    monitor_x=0,
+                    monitor_y=0,
+                    monitor_width=screen_width,
+                    monitor_height=screen_height,
+                    virtual_x=0,
+                    virtual_y=0,
+                    virtual_width=screen_width,
+                    virtual_height=screen_height,
+                )
 
         except (AttributeError, ValueError, TypeError) as e:
             logger.warning("Error getting monitor info: %s", e)
             # Ultimate fallback
-            return {
-                "window_x": 100,
-                "window_y": 100,
-                "window_width": 800,
-                "window_height": 600,
-                "monitor_x": 0,
-                "monitor_y": 0,
-                "monitor_width": 1920,
-                "monitor_height": 1080,
-                "virtual_x": 0,
-                "virtual_y": 0,
-                "virtual_width": 1920,
-                "virtual_height": 1080,
-            }
+            return MonitorInfo(
+                window_x=100,
+                window_y=100,
+                window_width=800,
+                window_height=600,
+                monitor_x=0,
+                monitor_y=0,
+                monitor_width=1920,
+                monitor_height=1080,
+                virtual_x=0,
+                virtual_y=0,
+                virtual_width=1920,
+                virtual_height=1080,
+            )
 
     @staticmethod
-    def get_parent_window_info(parent: Union[ctk.CTk, ctk.CTkToplevel]) -> dict:
+    def get_parent_window_info(
+        parent: Union[ctk.CTk, ctk.CTkToplevel],
+    ) -> MonitorInfo:
         """Get information about the parent window and its monitor.
 
         Args:
             parent: Parent window (main window or toplevel)
 
         Returns:
-            dict: Dictionary containing parent window position and monitor info
+            MonitorInfo: Parent window position and monitor info
         """
-        monitor_info = WindowPositioner.get_monitor_info(parent)
-
-        # Convert to the expected format for backward compatibility
-        return {
-            "x": monitor_info["window_x"],
-            "y": monitor_info["window_y"],
-            "width": monitor_info["window_width"],
-            "height": monitor_info["window_height"],
-            "screen_width": monitor_info["monitor_width"],
-            "screen_height": monitor_info["monitor_height"],
-            "monitor_x": monitor_info["monitor_x"],
-            "monitor_y": monitor_info["monitor_y"],
-            "virtual_x": monitor_info["virtual_x"],
-            "virtual_y": monitor_info["virtual_y"],
-            "virtual_width": monitor_info["virtual_width"],
-            "virtual_height": monitor_info["virtual_height"],
-        }
+        # The MonitorInfo already carries every field callers need, so no
+        # renamed-key dict copy is required any more
+        return WindowPositioner.get_monitor_info(parent)
 
     @staticmethod
     def calculate_relative_position(
         window_width: int,
         window_height: int,
-        parent_info: dict,
+        parent_info: Union[Dict[str, int], MonitorInfo],
         offset_x: int = 50,
         offset_y: int = 50,
         position: str = "center_offset",
@@ -188,6 +321,7 @@ class WindowPositioner:
             window_width: Width of the window to position
             window_height: Height of the window to position
             parent_info: Parent window information from get_parent_window_info
+                (a MonitorInfo, or a legacy dict for backward compatibility)
             offset_x: Horizontal offset from parent (default: 50)
             offset_y: Vertical offset from parent (default: 50)
             position: Position strategy - "center_offset", "center", "top_right", "cascade"
@@ -195,16 +329,27 @@ class WindowPositioner:
         Returns:
             Tuple[int, int]: (x, y) coordinates for the window
         """
-        parent_x = parent_info["x"]
-        parent_y = parent_info["y"]
-        parent_width = parent_info["width"]
-        parent_height = parent_info["height"]
-        screen_width = parent_info["screen_width"]
-        screen_height = parent_info["screen_height"]
-
-        # Get monitor bounds for proper multi-monitor support
-        monitor_x = parent_info.get("monitor_x", 0)
-        monitor_y = parent_info.get("monitor_y", 0)
+        if isinstance(parent_info, MonitorInfo):
+            parent_x = parent_info.window_x
+            parent_y = parent_info.window_y
+            parent_width = parent_info.window_width
+            parent_height = parent_info.window_height
+            screen_width = parent_info.monitor_width
+            screen_height = parent_info.monitor_height
+            monitor_x = parent_info.monitor_x
+            monitor_y = parent_info.monitor_y
+        else:
+            # Legacy dict format
+            parent_x = parent_info["x"]
+            parent_y = parent_info["y"]
+            parent_width = parent_info["width"]
+            parent_height = parent_info["height"]
+            screen_width = parent_info["screen_width"]
+            screen_height = parent_info["screen_height"]
+
+            # Get monitor bounds for proper multi-monitor support
+            monitor_x = parent_info.get("monitor_x", 0)
+            monitor_y = parent_info.get("monitor_y", 0)
 
         if position == "center":
             # Center on parent window
@@ -262,6 +407,10 @@ class WindowPositioner:
     ) -> None:
         """Position a window relative to its parent with multi-monitor support.
 
+        For best results, construct the toplevel and its content first, then
+        call this before the window is shown - the geometry is then applied
+        in a single call with no visible repositioning jump.
+
         Args:
             window: Window to position
             parent: Parent window (if None, will try to get from window.master)
@@ -283,14 +432,15 @@ class WindowPositioner:
                 WindowPositioner.center_on_screen(window, width, height)
                 return
 
-            # Update window to get current dimensions
-            window.update_idletasks()
-
-            # Get window dimensions
-            if width is None:
-                width = window.winfo_width()
-            if height is None:
-                height = window.winfo_height()
+            # Only force a synchronous reflow when we actually need to query
+            # the window's current dimensions
+            is_viewable = bool(window.winfo_viewable())
+            if width is None or height is None:
+                window.update_idletasks()
+                if width is None:
+                    width = window.winfo_width()
+                if height is None:
+                    height = window.winfo_height()
 
             # Get parent window info
             parent_info = WindowPositioner.get_parent_window_info(parent)
@@ -300,8 +450,15 @@ class WindowPositioner:
                 width, height, parent_info, offset_x, offset_y, position
             )
 
-            # Set window geometry
-            window.geometry(f"{width}x{height}+{x}+{y}")
+            # Set size and position in one atomic geometry request. For a
+            # visible window, hide it first so it appears in place instead of
+            # jumping from its old position.
+            if is_viewable:
+                window.withdraw()
+                window.wm_geometry(f"{width}x{height}+{x}+{y}")
+                window.deiconify()
+            else:
+                window.wm_geometry(f"{width}x{height}+{x}+{y}")
 
             logger.debug("Positioned window at (%d, %d) relative to parent", x, y)
 
@@ -337,10 +494,10 @@ class WindowPositioner:
             # Get monitor information for proper multi-monitor support
             monitor_info = WindowPositioner.get_monitor_info(window)
 
-            monitor_x = monitor_info["monitor_x"]
-            monitor_y = monitor_info["monitor_y"]
-            monitor_width = monitor_info["monitor_width"]
-            monitor_height = monitor_info["monitor_height"]
+            monitor_x = monitor_info.monitor_x
+            monitor_y = monitor_info.monitor_y
+            monitor_width = monitor_info.monitor_width
+            monitor_height = monitor_info.monitor_height
 
             # Calculate center position on the current monitor
             x = monitor_x + (monitor_width - width) // 2
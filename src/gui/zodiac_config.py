@@ -2,18 +2,36 @@
 Zodiac rarity configuration constants for Revolution Idle Sacrifice Automation.
 """
 
-from typing import Dict, Tuple
+from sys import intern
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
-# Zodiac rarity configuration with placeholder RGB values
-ZODIAC_RARITIES: Dict[str, Tuple[int, int, int]] = {
-    "Garbage": (128, 128, 128),  # Placeholder
-    "Common": (255, 255, 255),  # Placeholder
-    "Uncommon": (0, 255, 0),  # Placeholder
-    "Rare": (0, 0, 255),  # Placeholder
-    "Epic": (128, 0, 128),  # Placeholder
-    "Legendary": (255, 165, 0),  # Placeholder
-    "Mythic": (255, 192, 203),  # Placeholder
-    "Godly": (255, 215, 0),  # Placeholder
-    "Divine": (255, 20, 147),  # Placeholder
-    "Immortal": (115, 243, 189),
+# Zodiac rarity configuration with placeholder RGB values.
+# Keys are interned so repeated lookups hash the same string object, and the
+# mapping is wrapped in a read-only proxy so it can be shared safely across
+# threads without accidental mutation.
+_ZODIAC_RARITIES_RAW = {
+    intern(name): rgb
+    for name, rgb in {
+        "Garbage": (128, 128, 128),  # Placeholder
+        "Common": (255, 255, 255),  # Placeholder
+        "Uncommon": (0, 255, 0),  # Placeholder
+        "Rare": (0, 0, 255),  # Placeholder
+        "Epic": (128, 0, 128),  # Placeholder
+        "Legendary": (255, 165, 0),  # Placeholder
+        "Mythic": (255, 192, 203),  # Placeholder
+        "Godly": (255, 215, 0),  # Placeholder
+        "Divine": (255, 20, 147),  # Placeholder
+        "Immortal": (115, 243, 189),
+    }.items()
 }
+
+ZODIAC_RARITIES: Mapping[str, Tuple[int, int, int]] = MappingProxyType(
+    _ZODIAC_RARITIES_RAW
+)
+
+# Inverted lookup for going from an exact RGB value back to its rarity name
+# in O(1) instead of scanning ZODIAC_RARITIES.
+RGB_TO_RARITY: Mapping[Tuple[int, int, int], str] = MappingProxyType(
+    {rgb: name for name, rgb in _ZODIAC_RARITIES_RAW.items()}
+)
@@ -3,7 +3,8 @@ Zodiac grid widget component for Revolution Idle Sacrifice Automation.
 """
 
 import logging
-from typing import Any, List, Tuple
+import tkinter
+from typing import Any, List, Optional, Tuple
 
 import customtkinter as ctk  # type: ignore
 
@@ -31,11 +32,28 @@ class ZodiacGridWidget(ctk.CTkFrame):
         self.rows = rows
         self.cols = cols
         self.total_boxes = min(total_boxes, rows * cols)
-        self.selected_boxes: List[bool] = [False] * self.total_boxes
+        # One byte per box (0 = unselected, 1 = selected) - far more compact
+        # than a list of Python bools for large grid configurations
+        self._bits: bytearray = bytearray(self.total_boxes)
         self.box_buttons: List[ctk.CTkButton] = []
 
+        # Selection versioning so repeat callers can detect "no change" and
+        # reuse the cached snapshot instead of copying the list every call
+        self._selection_version: int = 0
+        self._cached_selection: Optional[Tuple[bool, ...]] = None
+        self._cached_version: int = -1
+
         self._create_grid()
 
+    @property
+    def selection_version(self) -> int:
+        """Get the current selection version.
+
+        The version is incremented whenever the selection changes, allowing
+        callers to skip recomputation when nothing has changed.
+        """
+        return self._selection_version
+
     def _create_grid(self) -> None:
         """Create the visual grid of zodiac boxes."""
         try:
@@ -61,11 +79,31 @@ class ZodiacGridWidget(ctk.CTkFrame):
                 button.grid(row=row, column=col, padx=2, pady=2, sticky="nsew")
                 self.box_buttons.append(button)
 
-            # Configure grid weights for centering
-            for i in range(self.cols):
-                self.grid_columnconfigure(i, weight=1)
-            for i in range(self.rows):
-                self.grid_rowconfigure(i, weight=1)
+            # Configure grid weights for centering. Tk accepts a list of
+            # indices per call, collapsing rows+cols round-trips into two.
+            try:
+                self.tk.call(
+                    "grid",
+                    "columnconfigure",
+                    self._w,
+                    tuple(range(self.cols)),
+                    "-weight",
+                    1,
+                )
+                self.tk.call(
+                    "grid",
+                    "rowconfigure",
+                    self._w,
+                    tuple(range(self.rows)),
+                    "-weight",
+                    1,
+                )
+            except tkinter.TclError:
+                # Older Tk versions only accept a single index per call
+                for i in range(self.cols):
+                    self.grid_columnconfigure(i, weight=1)
+                for i in range(self.rows):
+                    self.grid_rowconfigure(i, weight=1)
 
             logger.debug("Created zodiac grid with %d boxes", self.total_boxes)
         except (AttributeError, ValueError, TypeError) as e:
@@ -78,18 +116,19 @@ class ZodiacGridWidget(ctk.CTkFrame):
             index: Index of the box to toggle
         """
         try:
-            if 0 <= index < len(self.selected_boxes):
-                self.selected_boxes[index] = not self.selected_boxes[index]
+            if 0 <= index < len(self._bits):
+                self._bits[index] ^= 1
+                self._selection_version += 1
 
                 # Update button appearance
                 button = self.box_buttons[index]
-                if self.selected_boxes[index]:
+                if self._bits[index]:
                     button.configure(fg_color="green", hover_color="dark green")
                 else:
                     button.configure(fg_color="gray40", hover_color="gray30")
 
                 logger.debug(
-                    "Toggled zodiac box %d to %s", index + 1, self.selected_boxes[index]
+                    "Toggled zodiac box %d to %s", index + 1, bool(self._bits[index])
                 )
         except (IndexError, AttributeError) as e:
             logger.error("Error toggling zodiac box: %s", e, exc_info=True)
@@ -107,14 +146,17 @@ class ZodiacGridWidget(ctk.CTkFrame):
             self.cols = cols
             self.total_boxes = min(total_boxes, rows * cols)
 
-            # Resize selected_boxes list
-            current_size = len(self.selected_boxes)
+            # Resize the selection bitmap
+            current_size = len(self._bits)
             if self.total_boxes > current_size:
                 # Add new boxes (unselected by default)
-                self.selected_boxes.extend([False] * (self.total_boxes - current_size))
+                self._bits.extend(bytes(self.total_boxes - current_size))
             elif self.total_boxes < current_size:
                 # Remove excess boxes
-                self.selected_boxes = self.selected_boxes[: self.total_boxes]
+                del self._bits[self.total_boxes :]
+
+            if len(self._bits) != current_size:
+                self._selection_version += 1
 
             # Recreate the grid
             self._create_grid()
@@ -125,13 +167,18 @@ class ZodiacGridWidget(ctk.CTkFrame):
         except (AttributeError, ValueError, TypeError) as e:
             logger.error("Error updating zodiac grid: %s", e, exc_info=True)
 
-    def get_selected_boxes(self) -> List[bool]:
+    def get_selected_boxes(self) -> Tuple[bool, ...]:
         """Get the current selection state of all boxes.
 
         Returns:
-            List of boolean values indicating which boxes are selected
+            Tuple of boolean values indicating which boxes are selected.
+            The same tuple is returned until the selection changes, so
+            callers can cheaply compare snapshots by identity or version.
         """
-        return self.selected_boxes.copy()
+        if self._cached_version != self._selection_version:
+            self._cached_selection = tuple(bool(b) for b in self._bits)
+            self._cached_version = self._selection_version
+        return self._cached_selection  # type: ignore[return-value]
 
     def set_selected_boxes(self, selections: List[bool]) -> None:
         """Set the selection state of all boxes.
@@ -148,18 +195,31 @@ class ZodiacGridWidget(ctk.CTkFrame):
                 )
                 return
 
-            self.selected_boxes = selections.copy()
+            new_bits = bytearray(1 if selected else 0 for selected in selections)
+
+            # Idempotent restore (e.g. reopening the config dialog) - no
+            # widget work needed
+            if new_bits == self._bits:
+                logger.debug("Zodiac box selections unchanged, skipping update")
+                return
+
+            # Only restyle the buttons whose state actually changed
+            changed = [
+                i for i, (old, new) in enumerate(zip(self._bits, new_bits)) if old != new
+            ]
+
+            self._bits = new_bits
+            self._selection_version += 1
 
-            # Update button appearances
-            for i, selected in enumerate(self.selected_boxes):
+            for i in changed:
                 if i < len(self.box_buttons):
                     button = self.box_buttons[i]
-                    if selected:
+                    if self._bits[i]:
                         button.configure(fg_color="green", hover_color="dark green")
                     else:
                         button.configure(fg_color="gray40", hover_color="gray30")
 
-            logger.debug("Updated zodiac box selections")
+            logger.debug("Updated %d changed zodiac box selection(s)", len(changed))
         except (AttributeError, ValueError, TypeError, IndexError) as e:
             logger.error("Error setting zodiac box selections: %s", e, exc_info=True)
 
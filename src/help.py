@@ -7,10 +7,9 @@ functionality, configuration options, and usage instructions.
 
 from utils.display_utils import show_message
 
-
-def get_help_text() -> str:
-    """Returns the help text as a string for GUI use."""
-    return """
+# Built once at import time; get_help_text is a constant lookup so repeat
+# help requests never re-materialize the text
+_HELP_TEXT = """
     --- Revolution Idle Sacrifice Automation Script Help ---
 
     This script automates the zodiac sacrificing process in Revolution Idle.
@@ -104,7 +103,11 @@ def get_help_text() -> str:
     """
 
 
+def get_help_text() -> str:
+    """Returns the help text as a string for GUI use."""
+    return _HELP_TEXT
+
+
 def display_help() -> None:
     """Displays information about the script and its configurable options."""
-    help_message = get_help_text()
-    show_message(help_message, level="info")
+    show_message(_HELP_TEXT, level="info")